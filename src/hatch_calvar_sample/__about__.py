@@ -3,18 +3,13 @@
 # SPDX-License-Identifier: MIT
 """Version metadata for hatch_calvar_sample package."""
 
-# Import version function with fallback for Python < 3.8
-try:
-    from importlib.metadata import version as _version_func
-except ImportError:
-    # Python < 3.8
-    from importlib_metadata import (
-        version as _version_func,  # type: ignore[no-untyped-call]
-    )
+import functools
+from importlib.metadata import version as _version_func
 
 
+@functools.lru_cache(maxsize=None)
 def get_package_version(package_name: str) -> str:
-    """Get version from package metadata."""
+    """Get version from package metadata (cached per package name)."""
     return _version_func(package_name)
 
 
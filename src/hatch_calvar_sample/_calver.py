@@ -0,0 +1,315 @@
+# SPDX-FileCopyrightText: 2026-present QAToolist <qatoolist@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""Calculate next CalVer version (YYYY.MM.DD.MICRO) from git tags.
+
+This module only depends on the standard library, so it can also be copied
+into another project and run directly as a script.
+"""
+
+import functools
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+CALVER_PATTERN = re.compile(
+    r"^v?(?P<year>\d{4})\.(?P<month>\d{2})\.(?P<day>\d{2})\.(?P<micro>\d+)$",
+    re.ASCII,
+)
+
+
+# Resolved once at import; None when git is not installed (e.g. minimal
+# build containers), in which case no subprocess is spawned at all.
+_GIT = shutil.which("git")
+
+
+def parse_calver_tag(tag: str) -> Optional[Tuple[int, int, int, int]]:
+    """Parse a CalVer tag string into (year, month, day, micro).
+
+    Supports both 'vYYYY.MM.DD.MICRO' and 'YYYY.MM.DD.MICRO' formats.
+
+    Args:
+        tag: Git tag string
+
+    Returns:
+        Tuple of (year, month, day, micro) or None if invalid
+    """
+    # Hand-rolled equivalent of CALVER_PATTERN; avoids the regex engine on
+    # what is called once per tag.
+    value = tag.strip()
+    if value[:1] == "v":
+        value = value[1:]
+
+    parts = value.split(".")
+    if len(parts) != 4:
+        return None
+    year_str, month_str, day_str, micro_str = parts
+    if len(year_str) != 4 or len(month_str) != 2 or len(day_str) != 2:
+        return None
+    if not micro_str or not value.isascii():
+        return None
+    if not (
+        year_str.isdigit()
+        and month_str.isdigit()
+        and day_str.isdigit()
+        and micro_str.isdigit()
+    ):
+        return None
+
+    try:
+        year = int(year_str)
+        month = int(month_str)
+        day = int(day_str)
+        micro = int(micro_str)
+    except ValueError:
+        # e.g. a MICRO longer than the int string conversion limit
+        return None
+
+    # Basic validation
+    if not (1 <= month <= 12):
+        return None
+    if not (1 <= day <= 31):
+        return None
+    if micro < 1:
+        return None
+
+    return (year, month, day, micro)
+
+
+def parse_calver_tags_batch(
+    tags: Iterable[str],
+) -> List[Optional[Tuple[int, int, int, int]]]:
+    """Parse many CalVer tag strings at once.
+
+    Args:
+        tags: Git tag strings
+
+    Returns:
+        List with one (year, month, day, micro) tuple or None per input tag,
+        in input order
+    """
+    parse = parse_calver_tag
+    return [parse(tag) for tag in tags]
+
+
+def _git_env() -> Dict[str, str]:
+    """Return the environment used for git subprocesses.
+
+    Pins the C locale so output is plain refnames, and disables optional
+    locks so listing tags never contends with a concurrent fetch.
+    """
+    return {**os.environ, "LC_ALL": "C", "GIT_OPTIONAL_LOCKS": "0"}
+
+
+def iter_git_tags(remote: bool = False, patterns: Sequence[str] = ()) -> Iterator[str]:
+    """Yield git tags as git prints them.
+
+    Tags are read from the local repository; by default no fetch is
+    performed, so the caller (e.g. the CI checkout step) is responsible for
+    making tags available. Set ``CALVER_FETCH=1`` to run ``git fetch --tags``
+    first. Output is streamed rather than buffered, so callers that only need a
+    running aggregate never hold the full tag list in memory.
+
+    Args:
+        remote: Query tag names from ``origin`` via ``git ls-remote`` instead
+            of listing local tags
+        patterns: Glob patterns (e.g. ``'v2024.01.18.*'``) passed to git so
+            only matching tags are returned; all tags when empty
+
+    Yields:
+        Tag strings (including the 'v' prefix if present)
+    """
+    if _GIT is None:
+        # Git not available
+        return
+
+    if remote:
+        # Only ref names are transferred, not the tagged objects
+        command = [_GIT, "ls-remote", "--tags", "--refs", "origin", *patterns]
+    else:
+        command = [_GIT, "tag", "--list", *patterns]
+
+    try:
+        if not remote and os.environ.get("CALVER_FETCH") == "1":
+            # Opt-in: sync tags from the remote before listing them
+            subprocess.run(
+                [_GIT, "fetch", "--tags"],
+                capture_output=True,
+                check=False,
+                env=_git_env(),
+            )
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=_git_env(),
+        )
+    except FileNotFoundError:
+        # Git removed since import
+        return
+
+    # Exiting the context closes the pipe and reaps git, even if the caller
+    # stops iterating early. A failing git command simply yields nothing.
+    with process:
+        for raw in process.stdout or ():
+            # Refnames are almost always ASCII, which hits the decoder's fast
+            # path; anything else is replaced rather than raising.
+            line = raw.decode("utf-8", "replace")
+            if remote:
+                _, _, line = line.partition("\t")
+                if not line.startswith("refs/tags/"):
+                    continue
+                line = line[len("refs/tags/") :]
+            tag = line.strip()
+            if tag:
+                yield tag
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_git_tags(remote: bool) -> Tuple[str, ...]:
+    """Read git tags once per process, stored as an immutable tuple."""
+    return tuple(iter_git_tags(remote))
+
+
+def get_git_tags(remote: bool = False) -> List[str]:
+    """Return all git tags.
+
+    Tags are read from git once and cached for the lifetime of the process;
+    call ``_cached_git_tags.cache_clear()`` to force a re-read. Each call
+    returns a new list, so callers may modify it freely. Use iter_git_tags()
+    when a single pass over the tags is enough.
+
+    Args:
+        remote: Query tag names from ``origin`` via ``git ls-remote`` instead
+            of listing local tags
+
+    Returns:
+        List of tag strings (including the 'v' prefix if present)
+    """
+    return list(_cached_git_tags(remote))
+
+
+def get_current_date() -> Tuple[int, int, int]:
+    """Get current UTC date as (year, month, day).
+
+    Returns:
+        Tuple of (year, month, day) in UTC
+    """
+    now = time.gmtime()
+    return (now.tm_year, now.tm_mon, now.tm_mday)
+
+
+@functools.lru_cache(maxsize=1)
+def _date_prefix(year: int, month: int, day: int) -> str:
+    """Format the 'YYYY.MM.DD' prefix, cached since the date rarely changes."""
+    return f"{year:04d}.{month:02d}.{day:02d}"
+
+
+def calculate_next_version() -> str:
+    """Calculate next CalVer version based on git tags and current date.
+
+    Returns:
+        Version string in format 'YYYY.MM.DD.MICRO'
+    """
+    year, month, day = get_current_date()
+    date_prefix = _date_prefix(year, month, day)
+
+    # Let git return only today's tags, then make a single pass that checks
+    # the exact prefix (the glob also matches e.g. '-rc' suffixes) and
+    # tracks the highest MICRO seen.
+    prefix = f"{date_prefix}."
+    prefix_v = f"v{prefix}"
+    max_micro = 0
+    for tag in iter_git_tags(patterns=(f"{prefix}*", f"{prefix_v}*")):
+        if tag.startswith(prefix_v):
+            micro_str = tag[len(prefix_v) :]
+        elif tag.startswith(prefix):
+            micro_str = tag[len(prefix) :]
+        else:
+            continue
+        if not (micro_str.isascii() and micro_str.isdigit()):
+            continue
+        try:
+            micro = int(micro_str)
+        except ValueError:
+            # Too many digits to convert; not a usable tag
+            continue
+        if micro > max_micro:
+            max_micro = micro
+
+    # Calculate next MICRO number
+    next_micro = max_micro + 1
+
+    version = f"{date_prefix}.{next_micro}"
+    return version
+
+
+def validate_version_format(version: str) -> bool:
+    """Validate CalVer version format.
+
+    Args:
+        version: Version string to validate
+
+    Returns:
+        True if valid, False otherwise
+    """
+    return parse_calver_tag(version) is not None
+
+
+def check_pep440_compliance(version: str) -> bool:
+    """Check if version is PEP 440 compliant.
+
+    CalVer format YYYY.MM.DD.MICRO is PEP 440 compliant as a release segment
+    (with an optional 'v' prefix), so any version accepted by
+    validate_version_format() is compliant and no full PEP 440 parse is needed.
+
+    Args:
+        version: Version string to check
+
+    Returns:
+        True if PEP 440 compliant, False otherwise
+    """
+    return validate_version_format(version)
+
+
+def main():
+    """Main CLI entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Calculate next CalVer version (YYYY.MM.DD.MICRO)"
+    )
+    parser.add_argument(
+        "--validate", action="store_true", help="Validate calculated version format"
+    )
+    parser.add_argument(
+        "--pep440", action="store_true", help="Check PEP 440 compliance"
+    )
+    args = parser.parse_args()
+
+    try:
+        version = calculate_next_version()
+    except Exception as e:
+        print(f"Error calculating version: {e}", file=sys.stderr)
+        return 1
+
+    if args.validate:
+        if not validate_version_format(version):
+            print(f"Invalid version format: {version}", file=sys.stderr)
+            return 1
+
+    if args.pep440:
+        if not check_pep440_compliance(version):
+            print(f"Version not PEP 440 compliant: {version}", file=sys.stderr)
+            return 1
+
+    print(version)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,64 +1,46 @@
 """CLI tool for CalVer version management."""
 
-import argparse
-import json
+import functools
 import sys
 from pathlib import Path
-from typing import Optional
-
-# Import version function with fallback for Python < 3.8
-try:
-    from importlib.metadata import version as _version_func
-except ImportError:
-    # Python < 3.8
-    from importlib_metadata import (
-        version as _version_func,  # type: ignore[no-untyped-call]
-    )
-
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-# Import version calculation functions from script
-# We'll need to make these importable or duplicate the logic
-# For now, we'll import from the script directory
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
-try:
-    from calc_version import (
-        calculate_next_version,
-        check_pep440_compliance,
-        get_git_tags,
-        parse_calver_tag,
-        validate_version_format,
-    )
-except ImportError:
-    # Fallback if script not available
-    def calculate_next_version():
-        return "0.0.0.0"  # nosec B104
+from hatch_calvar_sample.__about__ import get_package_version
+from hatch_calvar_sample._calver import (
+    calculate_next_version,
+    check_pep440_compliance,
+    iter_git_tags,
+    parse_calver_tag,
+    validate_version_format,
+)
 
-    def validate_version_format(version: str) -> bool:
-        return bool(version)
+if TYPE_CHECKING:
+    import argparse
 
-    def check_pep440_compliance(version: str) -> bool:
-        return True
+# argparse and json are imported where they are used so that importing this
+# module (e.g. for its helpers) does not pay for them.
 
-    def parse_calver_tag(tag: str):
-        return None
-
-    def get_git_tags():
-        return []
+# VERSION file written next to the package during development builds
+VERSION_FILE = Path(__file__).parent / "VERSION"
 
 
+@functools.lru_cache(maxsize=None)
 def get_package_version_from_metadata() -> Optional[str]:
     """Get version from installed package metadata.
 
+    The lookup scans ``sys.path`` for distribution metadata, so the result
+    (including a miss) is cached for the lifetime of the process.
+
     Returns:
         Version string or None if not available
     """
     try:
-        return _version_func("hatch-calvar-sample")
+        return get_package_version("hatch-calvar-sample")
     except Exception:
         return None
 
 
-def version_calc(args: argparse.Namespace) -> int:
+def version_calc(args: "argparse.Namespace") -> int:
     """Calculate next version.
 
     Args:
@@ -74,6 +56,8 @@ def version_calc(args: argparse.Namespace) -> int:
         return 1
 
     if args.json:
+        import json
+
         output = {"version": version}
         print(json.dumps(output))
     else:
@@ -82,7 +66,7 @@ def version_calc(args: argparse.Namespace) -> int:
     return 0
 
 
-def version_check(args: argparse.Namespace) -> int:
+def version_check(args: "argparse.Namespace") -> int:
     """Check current version from different sources.
 
     Args:
@@ -99,13 +83,16 @@ def version_check(args: argparse.Namespace) -> int:
         versions["package"] = pkg_version
 
     # Check git tags
-    git_tags = get_git_tags()
-    calver_tags = [tag for tag in git_tags if parse_calver_tag(tag)]
-    if calver_tags:
-        # Get latest CalVer tag
-        parsed_tags = [(tag, parse_calver_tag(tag)) for tag in calver_tags]
-        parsed_tags.sort(key=lambda x: x[1], reverse=True)  # Sort by date/micro
-        latest_tag = parsed_tags[0][0]
+    parsed_tags = (
+        (tag, parsed)
+        for tag in iter_git_tags()
+        for parsed in (parse_calver_tag(tag),)
+        if parsed
+    )
+    # Get latest CalVer tag (by date/micro)
+    latest = max(parsed_tags, key=lambda x: x[1], default=None)
+    if latest:
+        latest_tag = latest[0]
         # Remove 'v' prefix if present
         if latest_tag.startswith("v"):
             versions["git_tag"] = latest_tag[1:]
@@ -113,13 +100,12 @@ def version_check(args: argparse.Namespace) -> int:
             versions["git_tag"] = latest_tag
 
     # Check VERSION file
-    version_file = (
-        Path(__file__).parent.parent.parent / "src" / "hatch_calvar_sample" / "VERSION"
-    )
-    if version_file.exists():
-        versions["file"] = version_file.read_text().strip()
+    if VERSION_FILE.exists():
+        versions["file"] = VERSION_FILE.read_text().strip()
 
     if args.json:
+        import json
+
         output = {"versions": versions}
         print(json.dumps(output, indent=2))
     else:
@@ -134,7 +120,7 @@ def version_check(args: argparse.Namespace) -> int:
     return 0
 
 
-def version_validate(args: argparse.Namespace) -> int:
+def version_validate(args: "argparse.Namespace") -> int:
     """Validate version format.
 
     Args:
@@ -158,6 +144,8 @@ def version_validate(args: argparse.Namespace) -> int:
         is_pep440 = check_pep440_compliance(version)
 
     if args.json:
+        import json
+
         output = {
             "version": version,
             "valid_format": is_valid_format,
@@ -178,7 +166,7 @@ def version_validate(args: argparse.Namespace) -> int:
         return 0
 
 
-def version_compare(args: argparse.Namespace) -> int:
+def version_compare(args: "argparse.Namespace") -> int:
     """Compare two versions.
 
     Args:
@@ -214,6 +202,8 @@ def version_compare(args: argparse.Namespace) -> int:
         result = "=="
 
     if args.json:
+        import json
+
         output = {
             "version1": v1_str,
             "version2": v2_str,
@@ -226,7 +216,7 @@ def version_compare(args: argparse.Namespace) -> int:
     return 0
 
 
-def version_info(args: argparse.Namespace) -> int:
+def version_info(args: "argparse.Namespace") -> int:
     """Show version information.
 
     Args:
@@ -235,7 +225,7 @@ def version_info(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, 1 for error)
     """
-    info = {}
+    info: Dict[str, Any] = {}
 
     # Get next version
     try:
@@ -255,6 +245,8 @@ def version_info(args: argparse.Namespace) -> int:
         info["current_package_version"] = pkg_version
 
     if args.json:
+        import json
+
         print(json.dumps(info, indent=2))
     else:
         print("Version Information:")
@@ -266,6 +258,8 @@ def version_info(args: argparse.Namespace) -> int:
 
 def main():
     """Main CLI entry point."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="CalVer version management CLI", prog="calver-check"
     )
@@ -0,0 +1,69 @@
+"""Shared pytest fixtures."""
+
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path
+src_dir = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_dir))
+
+from hatch_calvar_sample._calver import (  # noqa: E402
+    iter_git_tags,
+    parse_calver_tags_batch,
+)
+
+# Tags created in the calver_repo fixture: prefixed and unprefixed tags for
+# 2024-01-18, a pre-release tag, other dates and a non-CalVer tag.
+CALVER_REPO_TAGS = [
+    "v2024.01.18.1",
+    "2024.01.18.2",
+    "v2024.01.18.5",
+    "v2024.01.18.6-rc1",
+    "2024.01.17.9",
+    "v2024.01.19.1",
+    "release-1",
+]
+
+
+@pytest.fixture(scope="session")
+def calver_repo(tmp_path_factory):
+    """Create a git repository holding CALVER_REPO_TAGS once per session."""
+    if shutil.which("git") is None:
+        pytest.skip("git is not installed")
+
+    repo = tmp_path_factory.mktemp("calver_repo")
+
+    def git(*args):
+        subprocess.run(
+            ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+            + ["-c", "commit.gpgsign=false", "-c", "tag.gpgsign=false", *args],
+            cwd=repo,
+            capture_output=True,
+            check=True,
+        )
+
+    git("init", "-q")
+    git("commit", "-q", "--allow-empty", "-m", "init")
+    for tag in CALVER_REPO_TAGS:
+        git("tag", tag)
+    return repo
+
+
+@pytest.fixture(scope="session")
+def parsed_calver_tags(calver_repo):
+    """Parse the calver_repo fixture's tags once for the whole test session.
+
+    Tags that are not CalVer are dropped.
+    """
+    cwd = os.getcwd()
+    os.chdir(calver_repo)
+    try:
+        tags = list(iter_git_tags())
+    finally:
+        os.chdir(cwd)
+    return [parsed for parsed in parse_calver_tags_batch(tags) if parsed]
@@ -1,5 +1,6 @@
-"""Tests for version calculation script."""
+"""Tests for version calculation."""
 
+import io
 import subprocess
 import sys
 from pathlib import Path
@@ -7,20 +8,35 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-# Add scripts directory to path
+# Add src and scripts directories to path
+src_dir = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_dir))
 scripts_dir = Path(__file__).parent.parent / "scripts"
 sys.path.insert(0, str(scripts_dir))
 
-from calc_version import (  # noqa: E402
+import calc_version  # noqa: E402
+
+from hatch_calvar_sample import _calver  # noqa: E402
+from hatch_calvar_sample._calver import (  # noqa: E402
     calculate_next_version,
     check_pep440_compliance,
     get_current_date,
     get_git_tags,
+    iter_git_tags,
     parse_calver_tag,
+    parse_calver_tags_batch,
     validate_version_format,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_git_tags_cache():
+    """Reset the per-process tag cache so each test sees its own mocks."""
+    _calver._cached_git_tags.cache_clear()
+    yield
+    _calver._cached_git_tags.cache_clear()
+
+
 class TestParseCalverTag:
     """Test CalVer tag parsing."""
 
@@ -52,6 +68,47 @@ class TestParseCalverTag:
         """Test parsing tag with invalid micro value."""
         assert parse_calver_tag("2024.01.18.0") is None  # Micro < 1
 
+    def test_parse_rejects_malformed_separators(self):
+        """Test parsing tags with extra or missing components."""
+        assert parse_calver_tag("2024.01.18.1.2") is None
+        assert parse_calver_tag("2024.01.18.") is None
+        assert parse_calver_tag("vv2024.01.18.1") is None
+        assert parse_calver_tag("2024.01.18.1-rc1") is None
+
+    def test_parse_oversized_micro(self):
+        """Test that a MICRO too long to convert to int is rejected."""
+        assert parse_calver_tag("2024.01.18." + "1" * 5000) is None
+
+    def test_parse_strips_whitespace(self):
+        """Test that surrounding whitespace is ignored."""
+        assert parse_calver_tag(" v2024.01.18.1\n") == (2024, 1, 18, 1)
+
+
+class TestParseCalverTagsBatch:
+    """Test batch CalVer tag parsing."""
+
+    def test_parse_batch_preserves_order(self):
+        """Test that results line up with the input tags."""
+        tags = ["v2024.01.18.1", "invalid", "2024.12.31.999"]
+        assert parse_calver_tags_batch(tags) == [
+            (2024, 1, 18, 1),
+            None,
+            (2024, 12, 31, 999),
+        ]
+
+    def test_parse_batch_accepts_iterables(self):
+        """Test parsing tags from a generator."""
+        tags = (f"2024.01.18.{micro}" for micro in range(1, 4))
+        assert parse_calver_tags_batch(tags) == [
+            (2024, 1, 18, 1),
+            (2024, 1, 18, 2),
+            (2024, 1, 18, 3),
+        ]
+
+    def test_parse_batch_empty(self):
+        """Test parsing an empty batch."""
+        assert parse_calver_tags_batch([]) == []
+
 
 class TestValidateVersionFormat:
     """Test version format validation."""
@@ -84,32 +141,155 @@ class TestGetCurrentDate:
         assert 1 <= day <= 31
 
 
+def fake_popen(stdout):
+    """Build a mock ``subprocess.Popen`` result streaming ``stdout``."""
+    process = MagicMock()
+    process.__enter__.return_value = process
+    process.stdout = io.BytesIO(stdout.encode("utf-8"))
+    return process
+
+
+@patch("hatch_calvar_sample._calver._GIT", "git")
 class TestGetGitTags:
     """Test getting git tags."""
 
-    @patch("calc_version.subprocess.run")
-    def test_get_git_tags_success(self, mock_run):
+    @patch("hatch_calvar_sample._calver.subprocess.Popen")
+    def test_get_git_tags_success(self, mock_popen):
         """Test getting git tags successfully."""
-        mock_run.return_value = MagicMock(
-            stdout="v2024.01.18.1\n2024.01.17.5\ntag1\n", returncode=0
-        )
+        mock_popen.return_value = fake_popen("v2024.01.18.1\n2024.01.17.5\ntag1\n")
         tags = get_git_tags()
-        assert isinstance(tags, list)
-        assert len(tags) > 0
+        assert tags == ["v2024.01.18.1", "2024.01.17.5", "tag1"]
 
-    @patch("calc_version.subprocess.run")
-    def test_get_git_tags_failure(self, mock_run):
+    @patch("hatch_calvar_sample._calver.subprocess.Popen")
+    def test_get_git_tags_failure(self, mock_popen):
         """Test handling git tags failure gracefully."""
-        mock_run.side_effect = subprocess.CalledProcessError(1, "git")
+        # git prints nothing on stdout when it fails (e.g. not a repository)
+        mock_popen.return_value = fake_popen("")
+        tags = get_git_tags()
+        assert tags == []
+
+    @patch("hatch_calvar_sample._calver.subprocess.Popen")
+    def test_get_git_tags_git_missing(self, mock_popen):
+        """Test handling missing git executable gracefully."""
+        mock_popen.side_effect = FileNotFoundError("git")
+        tags = get_git_tags()
+        assert tags == []
+
+    @patch("hatch_calvar_sample._calver.subprocess.Popen")
+    def test_get_git_tags_git_not_on_path(self, mock_popen):
+        """Test that no subprocess is spawned when git is not installed."""
+        with patch("hatch_calvar_sample._calver._GIT", None):
+            tags = get_git_tags()
+        assert tags == []
+        mock_popen.assert_not_called()
+
+    @patch.dict("os.environ", {"CALVER_FETCH": ""})
+    @patch("hatch_calvar_sample._calver.subprocess.run")
+    @patch("hatch_calvar_sample._calver.subprocess.Popen")
+    def test_get_git_tags_does_not_fetch(self, mock_popen, mock_run):
+        """Test that listing local tags does not fetch from the remote."""
+        mock_popen.return_value = fake_popen("v2024.01.18.1\n")
+        get_git_tags()
+        commands = [call.args[0] for call in mock_popen.call_args_list]
+        assert commands == [["git", "tag", "--list"]]
+        mock_run.assert_not_called()
+
+    @patch.dict("os.environ", {"CALVER_FETCH": "1"})
+    @patch("hatch_calvar_sample._calver.subprocess.run")
+    @patch("hatch_calvar_sample._calver.subprocess.Popen")
+    def test_get_git_tags_fetch_opt_in(self, mock_popen, mock_run):
+        """Test that CALVER_FETCH=1 fetches tags before listing them."""
+        mock_popen.return_value = fake_popen("v2024.01.18.1\n")
+        tags = get_git_tags()
+        assert tags == ["v2024.01.18.1"]
+        assert mock_run.call_args.args[0] == ["git", "fetch", "--tags"]
+
+    @patch.dict("os.environ", {"CALVER_FETCH": "1"})
+    @patch("hatch_calvar_sample._calver.subprocess.run")
+    @patch("hatch_calvar_sample._calver.subprocess.Popen")
+    def test_get_git_tags_fetch_git_missing(self, mock_popen, mock_run):
+        """Test that a missing git during the opt-in fetch yields no tags."""
+        mock_run.side_effect = FileNotFoundError("git")
         tags = get_git_tags()
         assert tags == []
+        mock_popen.assert_not_called()
+
+    @patch("hatch_calvar_sample._calver.subprocess.Popen")
+    def test_iter_git_tags_patterns(self, mock_popen):
+        """Test that tag patterns are passed through to git."""
+        mock_popen.return_value = fake_popen("v2024.01.18.1\n")
+        tags = list(iter_git_tags(patterns=("v2024.01.18.*",)))
+        assert tags == ["v2024.01.18.1"]
+        assert mock_popen.call_args.args[0] == [
+            "git",
+            "tag",
+            "--list",
+            "v2024.01.18.*",
+        ]
+
+    @patch("hatch_calvar_sample._calver.subprocess.Popen")
+    def test_get_git_tags_remote(self, mock_popen):
+        """Test listing tags from the remote via ls-remote."""
+        mock_popen.return_value = fake_popen(
+            "abc\trefs/tags/v2024.01.18.1\ndef\trefs/tags/2024.01.17.5\n"
+        )
+        tags = get_git_tags(remote=True)
+        assert tags == ["v2024.01.18.1", "2024.01.17.5"]
+        assert mock_popen.call_args.args[0] == [
+            "git",
+            "ls-remote",
+            "--tags",
+            "--refs",
+            "origin",
+        ]
+
+    @patch("hatch_calvar_sample._calver.subprocess.Popen")
+    def test_get_git_tags_pins_git_environment(self, mock_popen):
+        """Test that git runs with the C locale and without optional locks."""
+        mock_popen.return_value = fake_popen("v2024.01.18.1\n")
+        get_git_tags()
+        env = mock_popen.call_args.kwargs["env"]
+        assert env["LC_ALL"] == "C"
+        assert env["GIT_OPTIONAL_LOCKS"] == "0"
+
+    @patch("hatch_calvar_sample._calver.subprocess.Popen")
+    def test_get_git_tags_non_ascii(self, mock_popen):
+        """Test that non-ASCII tag names do not break tag listing."""
+        mock_popen.return_value = fake_popen("v2024.01.18.1\nr\u00e9lease\n")
+        assert get_git_tags() == ["v2024.01.18.1", "r\u00e9lease"]
+
+    @patch("hatch_calvar_sample._calver.subprocess.Popen")
+    def test_get_git_tags_cached(self, mock_popen):
+        """Test that tags are only read from git once per process."""
+        mock_popen.return_value = fake_popen("v2024.01.18.1\n")
+        assert get_git_tags() == get_git_tags()
+        assert mock_popen.call_count == 1
+
+    @patch("hatch_calvar_sample._calver.subprocess.Popen")
+    def test_get_git_tags_returns_independent_lists(self, mock_popen):
+        """Test that mutating a returned list does not change the cache."""
+        mock_popen.return_value = fake_popen("v2024.01.18.1\n")
+        tags = get_git_tags()
+        tags.append("v2024.01.18.2")
+        tags.sort(reverse=True)
+        assert get_git_tags() == ["v2024.01.18.1"]
+
+    @patch("hatch_calvar_sample._calver.subprocess.Popen")
+    def test_iter_git_tags_closes_process(self, mock_popen):
+        """Test that git is reaped when iteration stops early."""
+        process = fake_popen("v2024.01.18.1\nv2024.01.18.2\n")
+        mock_popen.return_value = process
+        tags = iter_git_tags()
+        assert next(tags) == "v2024.01.18.1"
+        tags.close()
+        process.__exit__.assert_called_once()
 
 
 class TestCalculateNextVersion:
     """Test calculating next version."""
 
-    @patch("calc_version.get_git_tags")
-    @patch("calc_version.get_current_date")
+    @patch("hatch_calvar_sample._calver.iter_git_tags")
+    @patch("hatch_calvar_sample._calver.get_current_date")
     def test_calculate_next_version_no_tags(self, mock_date, mock_tags):
         """Test calculating next version with no existing tags."""
         mock_date.return_value = (2024, 1, 18)
@@ -120,8 +300,8 @@ class TestCalculateNextVersion:
         assert version == "2024.01.18.1"
         assert validate_version_format(version)
 
-    @patch("calc_version.get_git_tags")
-    @patch("calc_version.get_current_date")
+    @patch("hatch_calvar_sample._calver.iter_git_tags")
+    @patch("hatch_calvar_sample._calver.get_current_date")
     def test_calculate_next_version_with_tags_same_date(self, mock_date, mock_tags):
         """Test calculating next version with tags on same date."""
         mock_date.return_value = (2024, 1, 18)
@@ -131,8 +311,8 @@ class TestCalculateNextVersion:
 
         assert version == "2024.01.18.3"
 
-    @patch("calc_version.get_git_tags")
-    @patch("calc_version.get_current_date")
+    @patch("hatch_calvar_sample._calver.iter_git_tags")
+    @patch("hatch_calvar_sample._calver.get_current_date")
     def test_calculate_next_version_with_tags_different_date(
         self, mock_date, mock_tags
     ):
@@ -145,8 +325,8 @@ class TestCalculateNextVersion:
         # Should reset to 1 for new date
         assert version == "2024.01.19.1"
 
-    @patch("calc_version.get_git_tags")
-    @patch("calc_version.get_current_date")
+    @patch("hatch_calvar_sample._calver.iter_git_tags")
+    @patch("hatch_calvar_sample._calver.get_current_date")
     def test_calculate_next_version_ignores_invalid_tags(self, mock_date, mock_tags):
         """Test that invalid tags are ignored."""
         mock_date.return_value = (2024, 1, 18)
@@ -157,16 +337,115 @@ class TestCalculateNextVersion:
         # Should increment based on valid tag
         assert version == "2024.01.18.2"
 
+    @patch("hatch_calvar_sample._calver.iter_git_tags")
+    @patch("hatch_calvar_sample._calver.get_current_date")
+    def test_calculate_next_version_skips_oversized_micro(self, mock_date, mock_tags):
+        """Test that a same-date tag with an unconvertible MICRO is skipped."""
+        mock_date.return_value = (2024, 1, 18)
+        mock_tags.return_value = ["v2024.01.18.2", "v2024.01.18." + "9" * 5000]
+
+        version = calculate_next_version()
+
+        assert version == "2024.01.18.3"
+
+    @patch("hatch_calvar_sample._calver.iter_git_tags")
+    @patch("hatch_calvar_sample._calver.get_current_date")
+    def test_calculate_next_version_filters_in_git(self, mock_date, mock_tags):
+        """Test that only the current date's tags are requested from git."""
+        mock_date.return_value = (2024, 1, 18)
+        mock_tags.return_value = []
+
+        calculate_next_version()
+
+        mock_tags.assert_called_once_with(patterns=("2024.01.18.*", "v2024.01.18.*"))
+
+    @patch("hatch_calvar_sample._calver.iter_git_tags")
+    @patch("hatch_calvar_sample._calver.get_current_date")
+    def test_calculate_next_version_mixed_prefixes(self, mock_date, mock_tags):
+        """Test that prefixed and unprefixed tags share one MICRO sequence."""
+        mock_date.return_value = (2024, 1, 18)
+        mock_tags.return_value = [
+            "v2024.01.18.3",
+            "2024.01.18.10",
+            "2024.01.18.11-rc1",
+            "2024.01.180.20",
+            "v2024.01.1.99",
+        ]
+
+        version = calculate_next_version()
+
+        assert version == "2024.01.18.11"
+
+
+class TestRepositoryTags:
+    """Test version calculation against a real git repository."""
+
+    def test_parsed_tags(self, parsed_calver_tags):
+        """Test that only valid CalVer tags are parsed from the repository."""
+        assert sorted(parsed_calver_tags) == [
+            (2024, 1, 17, 9),
+            (2024, 1, 18, 1),
+            (2024, 1, 18, 2),
+            (2024, 1, 18, 5),
+            (2024, 1, 19, 1),
+        ]
+
+    @pytest.mark.parametrize(
+        ("date", "expected"),
+        [
+            ((2024, 1, 18), "2024.01.18.6"),
+            ((2024, 1, 19), "2024.01.19.2"),
+            ((2024, 1, 20), "2024.01.20.1"),
+        ],
+    )
+    @patch("hatch_calvar_sample._calver.get_current_date")
+    def test_calculate_next_version(
+        self, mock_date, date, expected, calver_repo, monkeypatch
+    ):
+        """Test calculating the next version from the repository's tags."""
+        mock_date.return_value = date
+        monkeypatch.chdir(calver_repo)
+
+        assert calculate_next_version() == expected
+
 
 class TestPEP440Compliance:
     """Test PEP 440 compliance checking."""
 
     def test_check_pep440_valid_version(self):
         """Test PEP 440 compliance check for valid version."""
-        # This test depends on packaging library availability
-        result = check_pep440_compliance("2024.01.18.1")
-        # Should not raise an error at least
-        assert isinstance(result, bool)
+        assert check_pep440_compliance("2024.01.18.1") is True
+        assert check_pep440_compliance("v2024.01.18.1") is True
+
+    def test_check_pep440_invalid_version(self):
+        """Test PEP 440 compliance check for invalid version."""
+        assert check_pep440_compliance("invalid") is False
+        assert check_pep440_compliance("2024.01.18") is False
+
+    def test_check_pep440_rejects_non_ascii_digits(self):
+        """Test that non-ASCII digits are not accepted as CalVer."""
+        assert check_pep440_compliance("\u0662\u0660\u0662\u0664.01.18.1") is False
+
+
+class TestCalcVersionScript:
+    """Test the scripts/calc_version.py wrapper."""
+
+    def test_script_reexports_package_functions(self):
+        """Test that the script exposes the packaged implementation."""
+        assert calc_version.calculate_next_version is _calver.calculate_next_version
+        assert calc_version.parse_calver_tag is _calver.parse_calver_tag
+        assert calc_version.main is _calver.main
+
+    def test_script_runs_standalone(self):
+        """Test running the script as a command."""
+        result = subprocess.run(
+            [sys.executable, str(scripts_dir / "calc_version.py"), "--validate"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        assert result.returncode == 0
+        assert validate_version_format(result.stdout.strip())
 
 
 if __name__ == "__main__":
@@ -1,5 +1,8 @@
 """Tests for version checking CLI tool."""
 
+import json
+import os
+import subprocess
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -46,7 +49,7 @@ class TestVersionCheck:
     """Test version check command."""
 
     @patch("hatch_calvar_sample.cli.get_package_version_from_metadata")
-    @patch("hatch_calvar_sample.cli.get_git_tags")
+    @patch("hatch_calvar_sample.cli.iter_git_tags")
     def test_version_check_package_version(self, mock_tags, mock_pkg_version):
         """Test version check with package version available."""
         mock_pkg_version.return_value = "2024.01.18.1"
@@ -60,7 +63,28 @@ class TestVersionCheck:
         assert result == 0
 
     @patch("hatch_calvar_sample.cli.get_package_version_from_metadata")
-    @patch("hatch_calvar_sample.cli.get_git_tags")
+    @patch("hatch_calvar_sample.cli.iter_git_tags")
+    @patch.object(Path, "exists", return_value=False)
+    def test_version_check_latest_git_tag(
+        self, mock_path_exists, mock_tags, mock_pkg_version, capsys
+    ):
+        """Test version check reports the newest CalVer tag regardless of order."""
+        mock_pkg_version.return_value = None
+        mock_tags.return_value = iter(
+            ["v2024.01.18.2", "release-1", "2024.01.19.1", "v2024.01.18.10"]
+        )
+
+        args = MagicMock()
+        args.json = True
+
+        result = cli.version_check(args)
+
+        assert result == 0
+        output = json.loads(capsys.readouterr().out)
+        assert output == {"versions": {"git_tag": "2024.01.19.1"}}
+
+    @patch("hatch_calvar_sample.cli.get_package_version_from_metadata")
+    @patch("hatch_calvar_sample.cli.iter_git_tags")
     @patch.object(Path, "exists", return_value=False)
     def test_version_check_no_versions(
         self, mock_path_exists, mock_tags, mock_pkg_version
@@ -78,6 +102,24 @@ class TestVersionCheck:
         # Should return 1 when no versions found
         assert result == 1
 
+    @patch("hatch_calvar_sample.cli.get_package_version_from_metadata")
+    @patch.object(Path, "exists", return_value=False)
+    def test_version_check_repository_tags(
+        self, mock_path_exists, mock_pkg_version, calver_repo, monkeypatch, capsys
+    ):
+        """Test version check reports the newest tag of a real repository."""
+        mock_pkg_version.return_value = None
+        monkeypatch.chdir(calver_repo)
+
+        args = MagicMock()
+        args.json = True
+
+        result = cli.version_check(args)
+
+        assert result == 0
+        output = json.loads(capsys.readouterr().out)
+        assert output == {"versions": {"git_tag": "2024.01.19.1"}}
+
 
 class TestVersionValidate:
     """Test version validate command."""
@@ -190,5 +232,24 @@ class TestVersionInfo:
         assert result == 0
 
 
+class TestImportCost:
+    """Test that importing the CLI module stays lightweight."""
+
+    def test_import_does_not_load_argparse_or_json(self):
+        """Test that argparse and json are only imported when needed."""
+        code = (
+            "import sys; import hatch_calvar_sample.cli; "
+            "print(sorted({'argparse', 'json'} & set(sys.modules)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": str(src_dir)},
+        )
+        assert result.stdout.strip() == "[]"
+
+
 if __name__ == "__main__":
     pytest.main([__file__])